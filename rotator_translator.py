@@ -15,10 +15,18 @@ Key Features:
 - Returns responses in K4-Control format (AZ=nnn\r\n)
 """
 
+import collections
+import concurrent.futures
+import logging
+import os
+import queue
+import re
+import selectors
+import signal
 import socket
+import sys
 import threading
-import re
-from datetime import datetime
+import time
 
 
 # ============================================================================
@@ -32,8 +40,89 @@ RT21_PORT = 6555
 # Translator Listen Port (K4-Control connects here)
 LISTEN_PORT = 6555
 
+# Console log level - DEBUG logs every command, INFO adds connection events
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING")
+
 # ============================================================================
 
+# Precomputed protocol bytes so the hot path is a table lookup, not a
+# format + encode per command
+_AP_TABLE = tuple(f"AP0{i:03d}\r;".encode('ascii') for i in range(360))
+_AZ_REPLY = tuple(f"AZ={i:03d}\r\n".encode('ascii') for i in range(360))
+_QUERY = b"AI1\r;"
+_OK = b"OK\r\n"
+_ERR = b"ERROR\r\n"
+_STOP = b";"
+_STOP_COMMANDS = (b'S', b's', b'STOP', b'stop', b';')
+
+# Compiled once; matched directly against raw bytes
+_NUM_RE = re.compile(rb'\d+')
+# One K4-Control command and its terminator: a single ';' or a CR/LF run
+_FRAME_RE = re.compile(rb'([^\r\n;]*)(;|[\r\n]+)')
+# Unterminated bytes that may still become a valid command
+_PARTIAL_RE = re.compile(rb'[Mm]\d{0,2}|(?i:sto?)')
+
+# Kernel socket buffer size (SO_RCVBUF/SO_SNDBUF) and per-connection receive
+# buffer size; received data is read into a reused buffer with recv_into()
+SOCKET_BUFFER_SIZE = 131072
+RECV_SIZE = 1024
+
+# Listening sockets/event loops sharing the listen port via SO_REUSEPORT
+# (Linux only; elsewhere the kernel does not spread accepts, so one is used)
+SERVER_WORKERS = os.cpu_count() or 1
+
+# Dead RT21 detection: keepalive probes after KEEPALIVE_IDLE idle seconds,
+# every KEEPALIVE_INTERVAL seconds, giving up after KEEPALIVE_COUNT misses;
+# on Linux unacknowledged data also fails after USER_TIMEOUT_MS
+KEEPALIVE_IDLE = 5
+KEEPALIVE_INTERVAL = 2
+KEEPALIVE_COUNT = 3
+USER_TIMEOUT_MS = 10000
+
+# Unsent reply bytes at which a client that stops reading is disconnected
+OUTBOX_LIMIT = 65536
+
+# Linux-only; None on macOS, where quick ACKs are skipped
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+# Selector key data marking an event loop's wakeup socket
+_WAKEUP = object()
+
+# Seconds a queried RT21 position answers repeated C polls without a round trip
+POS_CACHE_TTL = 0.3
+
+# While RT21 is unreachable, requests get ERROR at once and reconnects are
+# attempted at most once every RT21_RETRY_INTERVAL seconds
+RT21_RETRY_INTERVAL = 3
+
+# Requests waiting for the RT21 worker; a client that overflows it is dropped
+RT21_QUEUE_SIZE = 64
+
+
+class ClientSession:
+    """State for one connected rotator software client"""
+
+    def __init__(self, client_socket, client_address, wake_socket):
+        """
+        Initialize the session.
+
+        Args:
+            client_socket: Non-blocking socket connection from rotator software
+            client_address: Address tuple of client
+            wake_socket: Wakeup socket of the event loop serving the client
+        """
+        self.client_socket = client_socket
+        self.client_address = client_address
+        self.wake_socket = wake_socket
+        self.rxbuf = bytearray(RECV_SIZE)
+        # Received bytes not yet framed into complete commands
+        self.buffer = bytearray()
+        # Replies posted by the RT21 worker, sent by the event loop
+        self.replies = collections.deque()
+        # Reply bytes the client's send buffer has not accepted yet
+        self.outbox = bytearray()
+        self.closed = False
+
 
 class RotatorProtocolTranslator:
     """Protocol translator for RT21 rotator device"""
@@ -50,44 +139,43 @@ class RotatorProtocolTranslator:
         self.rt21_ip = rt21_ip
         self.rt21_port = rt21_port
         self.listen_port = listen_port
-        self.running = False
-
-    def log_message(self, direction, message, protocol=""):
-        """
-        Log a message with timestamp to console.
-
-        Args:
-            direction: Type of message (RECEIVED, SENT, PARSED, etc.)
-            message: The message content
-            protocol: Protocol identifier (PROGRAM, RT21, TRANSLATOR, etc.)
-        """
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        log_entry = f"[{timestamp}] {direction} {protocol}: {repr(message)}"
-        print(log_entry)
+        # Set by stop() to stop the service; every loop checks it
+        self._stop_evt = threading.Event()
+        # Write ends of the event loops' wakeup socketpairs, so stop() can
+        # wake loops blocked in select() with no timeout
+        self._wake_sockets = []
+        self._wake_lock = threading.RLock()
+        self._log = logging.getLogger("rotator_translator")
+
+        # Shared persistent RT21 connection; RT21 accepts only one at a time
+        self.rt21_socket = None
+        self.rt21_lock = threading.Lock()
+        self.rt21_rxbuf = memoryview(bytearray(RECV_SIZE))
+        # Monotonic time before which no reconnect is attempted
+        self._rt21_retry_at = 0
+
+        # Last queried azimuth and the monotonic time it expires
+        self._pos_cache = (None, 0)
+        self._pos_lock = threading.Lock()
+        self.rt21_queue = queue.Queue(maxsize=RT21_QUEUE_SIZE)
 
     def format_rt21_command(self, azimuth):
         """
         Convert azimuth value to RT21 command format.
 
         Args:
-            azimuth: Azimuth value (0-359) or "stop" string
+            azimuth: Azimuth value (int, 0-359) or "stop" string
 
         Returns:
-            RT21 formatted command string:
+            RT21 formatted command bytes:
             - Position: AP0{3-digit-azimuth}\r; (e.g., AP0180\r;)
             - Stop: ;
         """
-        if isinstance(azimuth, str) and azimuth.lower() == "stop":
-            return ";"
+        if isinstance(azimuth, int) and 0 <= azimuth < 360:
+            return _AP_TABLE[azimuth]
 
-        try:
-            az_int = int(float(azimuth))
-            # Format as 3-digit zero-padded number
-            command = f"AP0{az_int:03d}\r;"
-            return command
-        except (ValueError, TypeError):
-            # Default to stop on invalid input
-            return ";"
+        # "stop", and default to stop on invalid input
+        return _STOP
 
     def parse_incoming_command(self, data):
         """
@@ -95,7 +183,7 @@ class RotatorProtocolTranslator:
 
         Supported commands:
         - C: Query current position
-        - Mnnn: Move to azimuth nnn (e.g., M030 = move to 30 degrees)
+        - Mnnn: Move to 3-digit azimuth nnn, 000-359 (e.g., M030 = move to 30 degrees)
         - S or STOP: Stop rotation
         - ;: Stop rotation
 
@@ -106,238 +194,706 @@ class RotatorProtocolTranslator:
             Parsed command: "query", "stop", or azimuth (int)
             Returns None if command is invalid
         """
-        data_str = data.decode('ascii', errors='ignore').strip()
-        self.log_message("RECEIVED", data_str, "PROGRAM")
+        self._log.debug("RECEIVED PROGRAM: %r", data)
+
+        # Work on the raw bytes; only the first byte is needed to dispatch
+        command = data.strip()
+        first = command[:1]
 
         # Query current position
-        if data_str.upper().startswith('C'):
-            self.log_message("PARSED", "Command: query", "TRANSLATOR")
+        if first in (b'C', b'c'):
+            self._log.debug("PARSED TRANSLATOR: query")
             return "query"
 
         # Move to azimuth command (e.g., M030)
-        if data_str.upper().startswith('M'):
-            match = re.match(r'^M(\d+)', data_str, re.IGNORECASE)
-            if match:
-                azimuth = int(match.group(1))
-                self.log_message("PARSED", f"Command: move to {azimuth}", "TRANSLATOR")
-                return azimuth
+        if first in (b'M', b'm'):
+            digits = command[1:4]
+            # Exactly three digits: M0300 is not a move to 030
+            if len(command) == 4 and digits.isdigit():
+                azimuth = int(digits)
+                if azimuth < 360:
+                    self._log.debug("PARSED TRANSLATOR: move to %d", azimuth)
+                    return azimuth
 
         # Stop commands
-        if data_str.upper() in ('S', 'STOP') or data_str == ';':
-            self.log_message("PARSED", "Command: stop", "TRANSLATOR")
+        if command in _STOP_COMMANDS or command.upper() == b'STOP':
+            self._log.debug("PARSED TRANSLATOR: stop")
             return "stop"
 
-        self.log_message("PARSED", "No valid command found", "TRANSLATOR")
+        self._log.debug("PARSED TRANSLATOR: no valid command found")
         return None
 
-    def query_rt21_position(self, rt21_socket):
+    def connect_rt21(self):
         """
-        Query current azimuth position from RT21 device.
+        Open the shared persistent connection to the RT21 device.
 
-        Sends AI1\r; command to RT21 and parses numeric response.
+        Must be called with rt21_lock held. Replaces any existing connection.
+        """
+        self.close_rt21()
+        rt21_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            rt21_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            rt21_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            rt21_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            rt21_socket.settimeout(5)
+            rt21_socket.connect((self.rt21_ip, self.rt21_port))
+            self.enable_keepalive(rt21_socket)
+            # Response timeout for every later RT21 read, set once here
+            rt21_socket.settimeout(2)
+        except Exception:
+            rt21_socket.close()
+            raise
+        self.rt21_socket = rt21_socket
+        self._log.info("CONNECTION RT21: connected to %s:%d", self.rt21_ip, self.rt21_port)
+
+    def enable_keepalive(self, sock):
+        """
+        Enable aggressive TCP keepalive so a silently dropped peer is detected.
+
+        Options missing on the current platform are skipped (macOS names the
+        idle time TCP_KEEPALIVE and has no TCP_USER_TIMEOUT).
+
+        Args:
+            sock: Connected TCP socket
+        """
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        idle_option = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+        options = (
+            (idle_option, KEEPALIVE_IDLE),
+            (getattr(socket, "TCP_KEEPINTVL", None), KEEPALIVE_INTERVAL),
+            (getattr(socket, "TCP_KEEPCNT", None), KEEPALIVE_COUNT),
+            (getattr(socket, "TCP_USER_TIMEOUT", None), USER_TIMEOUT_MS),
+        )
+        for option, value in options:
+            if option is None:
+                continue
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+            except OSError:
+                pass
+
+    def quickack(self, sock):
+        """
+        Ask the kernel to ACK the data just read immediately (Linux only).
+
+        TCP_QUICKACK is one-shot, so it is re-armed after every read to keep
+        delayed ACKs from stalling this request/response protocol. It is not
+        available on macOS, where this does nothing.
 
         Args:
-            rt21_socket: Open socket connection to RT21
+            sock: Connected TCP socket that was just read from
+        """
+        if _TCP_QUICKACK is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
+    def close_rt21(self):
+        """
+        Close the shared RT21 connection, if open.
+
+        Must be called with rt21_lock held. The next queued request reconnects.
+        """
+        if self.rt21_socket is None:
+            return
+        try:
+            self.rt21_socket.close()
+            self._log.info("CONNECTION RT21: disconnected")
+        except Exception:
+            pass
+        self.rt21_socket = None
+
+    def query_rt21_position(self):
+        """
+        Query current azimuth position from RT21 device.
+
+        Sends AI1\r; command to RT21 and parses numeric response.
+        Drops the shared connection if RT21 fails or closes it.
 
         Returns:
-            Current azimuth (int) or None on error
+            Current azimuth (int, 0-359) or None on error
         """
         try:
             # Send position query command
-            command = "AI1\r;"
-            rt21_socket.send(command.encode('ascii'))
-            self.log_message("SENT", command, "RT21")
+            self.rt21_socket.sendall(_QUERY)
+            self._log.debug("SENT RT21: %r", _QUERY)
 
             # Receive response (e.g., "030;")
-            response = rt21_socket.recv(1024)
+            nbytes = self.rt21_socket.recv_into(self.rt21_rxbuf)
+            self.quickack(self.rt21_socket)
+            response = self.rt21_rxbuf[:nbytes]
 
-            if response:
-                response_str = response.decode('ascii', errors='ignore').strip()
-                self.log_message("RESPONSE", response_str, "RT21")
+            if nbytes:
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("RESPONSE RT21: %r", bytes(response))
 
                 # Extract numeric azimuth from response
-                numbers = re.findall(r'\d+', response_str)
-                if numbers:
-                    azimuth = int(numbers[0])
+                number = _NUM_RE.search(response)
+                if number:
+                    # Wrap into 0-359 so replies index straight into _AZ_REPLY
+                    azimuth = int(number.group()) % 360
                     return azimuth
+            else:
+                self._log.error("ERROR TRANSLATOR: RT21 closed the connection")
+                self.close_rt21()
 
             return None
 
         except Exception as e:
-            self.log_message("ERROR", f"RT21 query failed: {e}", "TRANSLATOR")
+            self._log.error("ERROR TRANSLATOR: RT21 query failed: %s", e)
+            self.close_rt21()
             return None
 
-    def send_to_rt21(self, rt21_socket, command):
+    def send_to_rt21(self, command):
         """
         Send a command to RT21 device.
 
+        Drops the shared connection if RT21 fails or closes it.
+
         Args:
-            rt21_socket: Open socket connection to RT21
-            command: RT21 formatted command string
+            command: RT21 formatted command bytes
 
         Returns:
             Response bytes from RT21 or default OK/ERROR response
         """
         try:
-            rt21_socket.send(command.encode('ascii'))
-            self.log_message("SENT", command, "RT21")
+            self.rt21_socket.sendall(command)
+            self._log.debug("SENT RT21: %r", command)
 
-            # Try to receive response with short timeout
+            # Try to receive response within the connection's short timeout
             try:
-                rt21_socket.settimeout(2)
-                response = rt21_socket.recv(1024)
-                if response:
-                    self.log_message("RESPONSE", response.decode('ascii', errors='ignore'), "RT21")
+                nbytes = self.rt21_socket.recv_into(self.rt21_rxbuf)
+                self.quickack(self.rt21_socket)
+                if nbytes:
+                    response = bytes(self.rt21_rxbuf[:nbytes])
+                    self._log.debug("RESPONSE RT21: %r", response)
                     return response
+                self._log.error("ERROR TRANSLATOR: RT21 closed the connection")
+                self.close_rt21()
+                return _ERR
             except socket.timeout:
                 pass
 
-            return b"OK\r\n"
+            return _OK
 
         except Exception as e:
-            self.log_message("ERROR", f"RT21 communication failed: {e}", "TRANSLATOR")
-            return b"ERROR\r\n"
+            self._log.error("ERROR TRANSLATOR: RT21 communication failed: %s", e)
+            self.close_rt21()
+            return _ERR
 
-    def handle_client(self, client_socket, client_address):
+    def get_cached_position(self):
+        """
+        Return the last queried azimuth if it is still fresh.
+
+        Returns:
+            Cached azimuth (int) or None if expired or invalidated
         """
-        Handle incoming connection from rotator software.
+        with self._pos_lock:
+            azimuth, deadline = self._pos_cache
+        if time.monotonic() < deadline:
+            return azimuth
+        return None
 
-        Opens persistent connection to RT21 and processes commands until client disconnects.
+    def cache_position(self, azimuth):
+        """
+        Remember an azimuth queried from RT21 for POS_CACHE_TTL seconds.
 
         Args:
-            client_socket: Socket connection from rotator software
-            client_address: Address tuple of client
+            azimuth: Azimuth (int) reported by RT21
         """
-        self.log_message("CONNECTION", f"Client connected: {client_address}", "PROXY")
+        with self._pos_lock:
+            self._pos_cache = (azimuth, time.monotonic() + POS_CACHE_TTL)
+
+    def invalidate_position_cache(self):
+        """Expire the cached azimuth so the next query goes to RT21."""
+        with self._pos_lock:
+            self._pos_cache = (None, 0)
 
-        rt21_socket = None
+    def stop(self):
+        """
+        Stop the service and wake every thread blocked waiting for work.
+
+        Safe to call more than once and from a signal handler.
+        """
+        self._stop_evt.set()
+        # Sentinel that ends rt21_worker(); a full queue is never empty, so
+        # the worker sees the stop event on its next item instead
         try:
-            # Open persistent connection to RT21 device
-            # This connection stays open for the entire session to avoid RT21's
-            # one-connection-at-a-time limitation
-            rt21_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            rt21_socket.settimeout(5)
-            rt21_socket.connect((self.rt21_ip, self.rt21_port))
-            self.log_message("CONNECTION", f"Connected to RT21 at {self.rt21_ip}:{self.rt21_port}", "RT21")
-
-            # Process commands until client disconnects
-            while self.running:
-                data = client_socket.recv(1024)
-                if not data:
-                    break
-
-                # Parse incoming command
-                command = self.parse_incoming_command(data)
-
-                if command is not None:
-                    # Handle position query command
-                    if command == "query":
-                        current_azimuth = self.query_rt21_position(rt21_socket)
-                        if current_azimuth is not None:
-                            # K4-Control format: AZ=nnn\r\n
-                            program_response = f"AZ={current_azimuth:03d}\r\n"
-                            client_socket.send(program_response.encode('ascii'))
-                            self.log_message("REPLIED", program_response.strip(), "PROGRAM")
-                        else:
-                            client_socket.send(b"ERROR\r\n")
-                            self.log_message("REPLIED", "ERROR", "PROGRAM")
-
-                    # Handle stop command
-                    elif command == "stop":
-                        rt21_command = self.format_rt21_command(command)
-                        self.send_to_rt21(rt21_socket, rt21_command)
-                        client_socket.send(b"OK\r\n")
-                        self.log_message("REPLIED", "OK", "PROGRAM")
-
-                    # Handle move to azimuth command
-                    else:
-                        rt21_command = self.format_rt21_command(command)
-                        self.send_to_rt21(rt21_socket, rt21_command)
-                        # Send simple OK - let queries report actual position
-                        client_socket.send(b"OK\r\n")
-                        self.log_message("REPLIED", "OK", "PROGRAM")
+            self.rt21_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        with self._wake_lock:
+            for wake_socket in self._wake_sockets:
+                try:
+                    wake_socket.send(b"\0")
+                except OSError:
+                    pass
+
+    def rt21_worker(self):
+        """
+        Process queued client requests over the shared RT21 connection.
+
+        Runs in a dedicated thread so every client is serialized through the
+        one RT21 connection, and the server event loop never blocks on RT21.
+        Each queue item is a (command, session) tuple, where command is a
+        value returned by parse_incoming_command(); stop() queues None to end
+        the worker.
+        """
+        while True:
+            item = self.rt21_queue.get()
+            if item is None or self._stop_evt.is_set():
+                break
+            try:
+                self.process_request(*item)
+            except Exception as e:
+                self._log.error("ERROR TRANSLATOR: request failed: %s", e)
+
+    def process_request(self, command, session):
+        """
+        Forward one client request to RT21 and post the reply to the client.
+
+        Args:
+            command: Value returned by parse_incoming_command()
+            session: ClientSession that sent the command
+        """
+        # The client disconnected while the request was queued
+        if session.closed:
+            return
+
+        # Answer repeated position polls from the short-lived cache
+        if command == "query":
+            current_azimuth = self.get_cached_position()
+            if current_azimuth is not None:
+                self.post_reply(session, _AZ_REPLY[current_azimuth])
+                return
+
+        with self.rt21_lock:
+            if (command is not None and self.rt21_socket is None
+                    and time.monotonic() >= self._rt21_retry_at):
+                try:
+                    self.connect_rt21()
+                except Exception as e:
+                    self._rt21_retry_at = time.monotonic() + RT21_RETRY_INTERVAL
+                    self._log.error("ERROR TRANSLATOR: RT21 reconnect failed: %s", e)
+
+            if command is None or self.rt21_socket is None:
+                # Unknown/invalid command or RT21 unreachable
+                response = _ERR
+
+            # Handle position query command
+            elif command == "query":
+                current_azimuth = self.query_rt21_position()
+                if current_azimuth is not None:
+                    self.cache_position(current_azimuth)
+                    # K4-Control format: AZ=nnn\r\n
+                    response = _AZ_REPLY[current_azimuth]
                 else:
-                    # Unknown/invalid command
-                    client_socket.send(b"ERROR\r\n")
+                    response = _ERR
+
+            # Handle stop and move to azimuth commands
+            else:
+                # Rotator is about to move; the cached position is stale
+                self.invalidate_position_cache()
+                rt21_command = self.format_rt21_command(command)
+                self.send_to_rt21(rt21_command)
+                # Send simple OK - let queries report actual position
+                response = _OK
+
+        self.post_reply(session, response)
+
+    def post_reply(self, session, response):
+        """
+        Queue a response for a client and wake the event loop that serves it.
+
+        The client socket belongs to its event loop, so the RT21 worker never
+        writes to it directly; the loop sends the reply in flush_replies().
+        Replies for a client that has disconnected are dropped.
+
+        Args:
+            session: ClientSession to reply to
+            response: K4-Control formatted response bytes
+        """
+        if session.closed:
+            return
+        session.replies.append(response)
+        try:
+            session.wake_socket.send(b"\0")
+        except OSError:
+            # Wakeup already pending (buffer full) or the loop has exited
+            pass
+
+    def flush_replies(self, selector, session):
+        """
+        Send a client's pending replies without blocking the event loop.
+
+        Whatever the client's send buffer does not accept stays in the
+        session outbox, with the socket registered for EVENT_WRITE until it
+        drains.
+
+        Args:
+            selector: Selector driving the server event loop
+            session: ClientSession with replies to send
+
+        Returns:
+            True if the session should stay open, False once the client
+            has failed or stopped reading replies
+        """
+        client_socket = session.client_socket
+        while session.replies:
+            response = session.replies.popleft()
+            self._log.debug("REPLIED PROGRAM: %r", response)
+            session.outbox += response
+
+        if session.outbox:
+            try:
+                del session.outbox[:client_socket.send(session.outbox)]
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                self._log.error("ERROR PROXY: reply to client failed: %s", e)
+                return False
+            if len(session.outbox) > OUTBOX_LIMIT:
+                self._log.error("ERROR PROXY: client is not reading replies")
+                return False
+
+        events = selectors.EVENT_READ
+        if session.outbox:
+            events |= selectors.EVENT_WRITE
+        if selector.get_key(client_socket).events != events:
+            selector.modify(client_socket, events, data=session)
+        return True
+
+    def accept_client(self, selector, server_socket, wake_socket):
+        """
+        Accept a rotator software connection and register it with the event loop.
+
+        Args:
+            selector: Selector driving the server event loop
+            server_socket: Listening socket with a pending connection
+            wake_socket: Wakeup socket of the event loop
+        """
+        client_socket, client_address = server_socket.accept()
+        # Send each small command/reply immediately (disable Nagle)
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client_socket.setblocking(False)
+        self._log.info("CONNECTION PROXY: client connected: %s", client_address)
+
+        session = ClientSession(client_socket, client_address, wake_socket)
+        selector.register(client_socket, selectors.EVENT_READ, data=session)
+
+    def close_client(self, selector, session):
+        """
+        Unregister a client session and close its connection.
+
+        Requests the session still has queued are dropped by the RT21
+        worker, so a stale move is never sent on the client's behalf. The
+        shared RT21 connection stays open for the next client.
+
+        Args:
+            selector: Selector driving the server event loop
+            session: ClientSession to close
+        """
+        session.closed = True
+        selector.unregister(session.client_socket)
+        session.client_socket.close()
+        self._log.info("CONNECTION PROXY: client disconnected")
+
+    def extract_commands(self, buffer):
+        """
+        Remove and return every complete command framed in a receive buffer.
+
+        Commands are terminated by CR, LF or ';'; a run of CR/LF (e.g.
+        "\r\n") ends a single command. A ';' with no command before it
+        (e.g. after another command's CR/LF) is the ; stop command itself,
+        so "C\r\n;" is a query followed by a stop. Unterminated trailing
+        bytes are left in the buffer.
+
+        Args:
+            buffer: Session bytearray of received, unprocessed bytes
+
+        Returns:
+            List of command frames (bytes), in the order received
+        """
+        frames = []
+        end = 0
+        for match in _FRAME_RE.finditer(buffer):
+            body, terminators = match.groups()
+            if body.strip():
+                frames.append(body)
+            elif terminators == b';':
+                frames.append(b';')
+            end = match.end()
+        del buffer[:end]
+        return frames
+
+    def handle_client(self, session):
+        """
+        Handle data from a connected rotator software client.
+
+        Called by the event loop when the client socket is readable; frames
+        every complete command received (several may arrive in one read),
+        parses each and queues it for the RT21 worker, which posts the reply
+        back to this event loop once RT21 has answered. Invalid commands are queued too so
+        replies always go out in request order.
+
+        Args:
+            session: ClientSession for the readable client
+
+        Returns:
+            True if the session should stay open, False once the client
+            has disconnected or failed
+        """
+        client_socket = session.client_socket
+
+        try:
+            try:
+                nbytes = client_socket.recv_into(session.rxbuf)
+            except BlockingIOError:
+                return True
+            if not nbytes:
+                return False
+            self.quickack(client_socket)
+            session.buffer += memoryview(session.rxbuf)[:nbytes]
+
+            # Parse each complete command and hand it to the RT21 worker
+            for frame in self.extract_commands(session.buffer):
+                command = self.parse_incoming_command(frame)
+                self.queue_request(command, session)
+
+            # Senders that don't terminate commands: anything left over that
+            # cannot grow into a valid command is processed as-is. A bare S
+            # is a complete stop, so it is processed at once (a STOP split
+            # as S + TOP stops, then gets ERROR for TOP)
+            tail = bytes(session.buffer).strip()
+            if not tail:
+                session.buffer.clear()
+            elif not _PARTIAL_RE.fullmatch(tail):
+                session.buffer.clear()
+                command = self.parse_incoming_command(tail)
+                self.queue_request(command, session)
+            return True
 
         except Exception as e:
-            self.log_message("ERROR", f"Client handler error: {e}", "PROXY")
+            self._log.error("ERROR PROXY: client handler error: %s", e)
+            return False
+
+    def queue_request(self, command, session):
+        """
+        Queue a parsed client command for the RT21 worker.
+
+        Raises queue.Full once RT21_QUEUE_SIZE requests are waiting, so the
+        client that keeps sending while RT21 is not keeping up is dropped.
+
+        Args:
+            command: Value returned by parse_incoming_command()
+            session: ClientSession that sent the command
+        """
+        try:
+            self.rt21_queue.put_nowait((command, session))
+        except queue.Full:
+            raise queue.Full("RT21 request queue is full") from None
+
+    def check_port_available(self):
+        """
+        Fail fast if another process is already listening on the listen port.
+
+        SO_REUSEPORT would otherwise let a second translator silently share
+        the port, splitting K4-Control connections between two processes
+        that compete for RT21's single connection. A plain bind (without
+        SO_REUSEPORT) fails with "Address already in use" if anything is
+        listening, matching the single-socket behavior.
+        """
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            probe.bind(('0.0.0.0', self.listen_port))
         finally:
-            # Clean up connections
-            if rt21_socket:
-                try:
-                    rt21_socket.close()
-                    self.log_message("CONNECTION", "Disconnected from RT21", "RT21")
-                except Exception:
-                    pass
+            probe.close()
 
-            client_socket.close()
-            self.log_message("CONNECTION", "Client disconnected", "PROXY")
+    def create_server_socket(self, reuse_port):
+        """
+        Create a non-blocking listening socket on the listen port.
 
-    def start_server(self):
-        """Start TCP server to listen for rotator software connections."""
+        Args:
+            reuse_port: Set SO_REUSEPORT so several sockets can share the port
+
+        Returns:
+            Bound, listening server socket
+        """
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            # Accepted client sockets inherit these buffer sizes
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
             server_socket.bind(('0.0.0.0', self.listen_port))
             server_socket.listen(5)
+            server_socket.setblocking(False)
+        except Exception:
+            server_socket.close()
+            raise
+        return server_socket
+
+    def run_event_loop(self, server_socket):
+        """
+        Accept and service clients on one listening socket until stopped.
+
+        A selector-driven event loop (epoll/kqueue) accepts clients and
+        services every client it accepted, instead of one thread each.
+
+        Args:
+            server_socket: Listening socket owned by this loop
+        """
+        selector = selectors.DefaultSelector()
+        # stop() and post_reply() write to wake_writer so select() can block
+        # without a timeout
+        wake_reader, wake_writer = socket.socketpair()
+        wake_reader.setblocking(False)
+        wake_writer.setblocking(False)
+        with self._wake_lock:
+            self._wake_sockets.append(wake_writer)
+        try:
+            selector.register(server_socket, selectors.EVENT_READ, data=None)
+            selector.register(wake_reader, selectors.EVENT_READ, data=_WAKEUP)
+
+            while not self._stop_evt.is_set():
+                for key, events in selector.select():
+                    session = key.data
+                    if session is _WAKEUP:
+                        self.drain_wakeups(wake_reader)
+                        if self._stop_evt.is_set():
+                            break
+                        # The RT21 worker posted replies
+                        for client_key in list(selector.get_map().values()):
+                            client = client_key.data
+                            if isinstance(client, ClientSession) and client.replies:
+                                if not self.flush_replies(selector, client):
+                                    self.close_client(selector, client)
+                    elif session is None:
+                        try:
+                            self.accept_client(selector, key.fileobj, wake_writer)
+                        except socket.error as e:
+                            if not self._stop_evt.is_set():
+                                self._log.error("ERROR PROXY: server error: %s", e)
+                    elif session.closed:
+                        # Closed earlier in this batch of events
+                        continue
+                    elif events & selectors.EVENT_WRITE and not self.flush_replies(selector, session):
+                        self.close_client(selector, session)
+                    elif events & selectors.EVENT_READ and not self.handle_client(session):
+                        self.close_client(selector, session)
+
+        except Exception as e:
+            self._log.error("ERROR PROXY: server error: %s", e)
+        finally:
+            for key in list(selector.get_map().values()):
+                if isinstance(key.data, ClientSession):
+                    self.close_client(selector, key.data)
+            selector.close()
+            with self._wake_lock:
+                self._wake_sockets.remove(wake_writer)
+            wake_reader.close()
+            wake_writer.close()
+
+    def drain_wakeups(self, wake_reader):
+        """
+        Discard the wakeup bytes pending on an event loop's wakeup socket.
+
+        Args:
+            wake_reader: Non-blocking reading end of the wakeup socketpair
+        """
+        try:
+            while wake_reader.recv(RECV_SIZE):
+                pass
+        except BlockingIOError:
+            pass
+
+    def start_server(self):
+        """
+        Start TCP server to listen for rotator software connections.
+
+        On Linux, SERVER_WORKERS listening sockets share the port via
+        SO_REUSEPORT (the kernel spreads accepts across them) and each is
+        served by its own event loop on a bounded thread pool. Elsewhere
+        SO_REUSEPORT does not balance TCP accepts, so a single socket and
+        event loop are used.
+        """
+        reuse_port = (
+            sys.platform.startswith("linux")
+            and hasattr(socket, "SO_REUSEPORT")
+            and SERVER_WORKERS > 1
+        )
+        workers = SERVER_WORKERS if reuse_port else 1
+        server_sockets = []
+        try:
+            if reuse_port:
+                self.check_port_available()
+            for _ in range(workers):
+                server_sockets.append(self.create_server_socket(reuse_port))
 
             print(f"Protocol Translator started on port {self.listen_port}")
             print(f"Forwarding to RT21 at {self.rt21_ip}:{self.rt21_port}")
             print("-" * 60)
 
-            while self.running:
-                try:
-                    client_socket, client_address = server_socket.accept()
-                    # Handle each client in separate thread
-                    client_thread = threading.Thread(
-                        target=self.handle_client,
-                        args=(client_socket, client_address)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-
-                except socket.error as e:
-                    if self.running:
-                        print(f"Server error: {e}")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                for server_socket in server_sockets:
+                    executor.submit(self.run_event_loop, server_socket)
 
         except Exception as e:
-            print(f"Failed to start server: {e}")
+            self._log.error("ERROR PROXY: failed to start server: %s", e)
+            # Nothing can reach the translator; stop instead of idling
+            self.stop()
         finally:
-            try:
-                server_socket.close()
-            except Exception:
-                pass
+            for server_socket in server_sockets:
+                try:
+                    server_socket.close()
+                except Exception:
+                    pass
 
     def start(self):
         """Start the protocol translator service."""
-        self.running = True
+        # Ctrl+C (or a termination request) stops the service immediately
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, lambda *_: self.stop())
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
 
         print("=== ROTATOR PROTOCOL TRANSLATOR ===")
         print("Converts rotator protocols to RT21 format")
         print()
 
-        # Test RT21 connection at startup
+        # Test RT21 connection at startup; the connection is kept as the
+        # shared persistent RT21 connection used by all clients
         print("Testing RT21 connection...")
-        try:
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_socket.settimeout(5)
-            test_socket.connect((self.rt21_ip, self.rt21_port))
-
-            # Query position to verify connection
-            test_socket.send(b"AI1\r;")
-            response = test_socket.recv(1024)
-            test_socket.close()
-
-            if response:
-                azimuth = response.decode('ascii', errors='ignore').strip()
-                print(f"✓ RT21 connected - Current position: {azimuth}")
-            else:
-                print("⚠️  Warning: RT21 connected but no response")
-        except Exception as e:
-            print(f"⚠️  Warning: Could not connect to RT21 device - {e}")
+        with self.rt21_lock:
+            try:
+                self.connect_rt21()
+
+                # Query position to verify connection and seed the position cache
+                azimuth = self.query_rt21_position()
+                if azimuth is not None:
+                    self.cache_position(azimuth)
+                    print(f"✓ RT21 connected - Current position: {azimuth:03d}")
+                elif self.rt21_socket is None:
+                    # query_rt21_position() already dropped the connection
+                    print("⚠️  Warning: RT21 connected but did not answer - connection dropped")
+                    print("   Will retry on the first K4-Control request")
+                else:
+                    print("⚠️  Warning: RT21 connected but sent no position")
+            except Exception as e:
+                print(f"⚠️  Warning: Could not connect to RT21 device - {e}")
+                print("   Will retry on the first K4-Control request")
         print()
 
+        # Serialize all RT21 traffic through one worker thread
+        worker_thread = threading.Thread(target=self.rt21_worker)
+        worker_thread.daemon = True
+        worker_thread.start()
+
         # Start server in background thread
         server_thread = threading.Thread(target=self.start_server)
         server_thread.daemon = True
@@ -347,17 +903,18 @@ class RotatorProtocolTranslator:
         print("Translator running. Press Ctrl+C to stop.")
         print("K4-Control can connect and disconnect as needed.\n")
         try:
-            while self.running:
-                threading.Event().wait(1)
+            self._stop_evt.wait()
         except KeyboardInterrupt:
             pass
         finally:
-            self.running = False
+            self.stop()
+            with self.rt21_lock:
+                self.close_rt21()
             print("\nTranslator stopped.")
 
 
 def test_rt21_commands():
-    """Test RT21 command formatting (for development/debugging)."""
+    """Test RT21 command formatting and K4-Control parsing (for development/debugging)."""
     translator = RotatorProtocolTranslator(
         rt21_ip=RT21_IP,
         rt21_port=RT21_PORT,
@@ -365,12 +922,13 @@ def test_rt21_commands():
     )
 
     test_cases = [
-        (0, "AP0000\r;"),
-        (35, "AP0035\r;"),
-        (180, "AP0180\r;"),
-        (359, "AP0359\r;"),
-        ("stop", ";"),
-        ("STOP", ";"),
+        (0, b"AP0000\r;"),
+        (35, b"AP0035\r;"),
+        (180, b"AP0180\r;"),
+        (359, b"AP0359\r;"),
+        (360, b";"),
+        ("stop", b";"),
+        ("STOP", b";"),
     ]
 
     print("Testing RT21 command formatting:")
@@ -381,15 +939,67 @@ def test_rt21_commands():
         status = "✓" if result == expected else "✗"
         print(f"{status} {input_val} -> {repr(result)} (expected: {repr(expected)})")
 
+    # (received bytes, expected command frames, expected unterminated leftover)
+    framing_cases = [
+        (b"C\rM030\r\n", [b"C", b"M030"], b""),
+        (b"M03", [], b"M03"),
+        (b"C\rM0", [b"C"], b"M0"),
+        (b"\r\n", [], b""),
+        (b";", [b";"], b""),
+        (b"C\r\n;", [b"C", b";"], b""),
+        (b"M030\r\n;", [b"M030", b";"], b""),
+    ]
 
-if __name__ == "__main__":
-    import sys
+    print()
+    print("Testing K4-Control command framing:")
+    print("-" * 30)
 
+    for input_val, expected, expected_left in framing_cases:
+        buffer = bytearray(input_val)
+        result = translator.extract_commands(buffer)
+        status = "✓" if result == expected and buffer == expected_left else "✗"
+        print(f"{status} {repr(input_val)} -> {repr(result)} + {repr(bytes(buffer))} "
+              f"(expected: {repr(expected)} + {repr(expected_left)})")
+
+    parse_cases = [
+        (b"C", "query"),
+        (b"M030", 30),
+        (b"M999", None),
+        (b"M30", None),
+        (b"M0300", None),
+        (b"M1234", None),
+        (b"S", "stop"),
+        (b"Stop", "stop"),
+        (b";", "stop"),
+    ]
+
+    print()
+    print("Testing K4-Control command parsing:")
+    print("-" * 30)
+
+    for input_val, expected in parse_cases:
+        result = translator.parse_incoming_command(input_val)
+        status = "✓" if result == expected else "✗"
+        print(f"{status} {repr(input_val)} -> {repr(result)} (expected: {repr(expected)})")
+
+
+if __name__ == "__main__":
     # Test mode for command formatting
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         test_rt21_commands()
     else:
         # Normal operation mode - use configuration values from top of file
+        # An unknown LOG_LEVEL falls back to WARNING instead of failing to start
+        log_level = logging.getLevelName(LOG_LEVEL.upper())
+        logging.basicConfig(
+            level=log_level if isinstance(log_level, int) else logging.WARNING,
+            format="[%(asctime)s.%(msecs)03d] %(message)s",
+            datefmt="%H:%M:%S"
+        )
+        if not isinstance(log_level, int):
+            logging.getLogger("rotator_translator").warning(
+                "Unknown LOG_LEVEL %r, using WARNING", LOG_LEVEL
+            )
         translator = RotatorProtocolTranslator(
             rt21_ip=RT21_IP,
             rt21_port=RT21_PORT,
@@ -31,7 +31,7 @@ OPTIONS = {
         'LSUIElement': False,
     },
     # Use includes instead of packages for built-in modules
-    'includes': ['socket', 'threading', 're', 'datetime'],
+    'includes': ['collections', 'concurrent.futures', 'logging', 'os', 'queue', 'selectors', 'signal', 'socket', 'sys', 'threading', 'time', 're'],
     # Exclude unnecessary packages to reduce size and avoid dependency issues
     'excludes': ['tkinter', 'unittest', 'test', 'setuptools', 'pkg_resources'],
     'semi_standalone': False,